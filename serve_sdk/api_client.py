@@ -27,23 +27,36 @@ class ApiClient:
     - 비즈니스 로직 (ServeClient가 담당)
     """
 
-    def __init__(self, server_url: str, team_service_url: Optional[str] = None, core_service_url: Optional[str] = None):
+    def __init__(self, server_url: str, team_service_url: Optional[str] = None,
+                 core_service_url: Optional[str] = None,
+                 http_session: Optional[requests.Session] = None):
         """
         Args:
             server_url: Auth 서버 기본 URL (예: http://localhost:8080)
             team_service_url: Team 서버 URL (예: http://localhost:8082). 미지정 시 server_url 사용.
             core_service_url: Core 서버 URL (예: http://localhost:8083). 미지정 시 server_url 사용.
+            http_session: 공유할 requests.Session. 미지정 시 전용 세션 생성.
+                같은 프로세스에서 여러 클라이언트를 쓸 때 하나를 주입하면
+                TCP/TLS 커넥션 풀을 공유하여 핸드셰이크를 반복하지 않는다.
         """
         self.server_url = server_url.rstrip('/')
         self.team_service_url = (team_service_url or server_url).rstrip('/')
         self.core_service_url = (core_service_url or server_url).rstrip('/')
-        self.session = requests.Session()
+        self.session = http_session if http_session is not None else requests.Session()
+
+        # 토큰별 인증 헤더 캐시 — 요청마다 같은 딕셔너리를 다시 만들지 않음
+        # (토큰은 세션당 하나라 사실상 항목 1~2개)
+        self._headers_cache: Dict[Optional[str], Dict[str, str]] = {}
 
     def _get_headers(self, access_token: Optional[str] = None) -> Dict[str, str]:
-        """인증 헤더 생성"""
-        headers = {"Content-Type": "application/json"}
-        if access_token:
-            headers["Authorization"] = f"Bearer {access_token}"
+        """인증 헤더 생성 (토큰별 캐시)"""
+        headers = self._headers_cache.get(access_token)
+        if headers is None:
+            headers = {"Content-Type": "application/json"}
+            if access_token:
+                headers["Authorization"] = f"Bearer {access_token}"
+            self._headers_cache.clear()  # 이전 토큰의 헤더는 더 이상 쓰지 않음
+            self._headers_cache[access_token] = headers
         return headers
 
     def _handle_response(self, response: requests.Response) -> Tuple[bool, Any]:
@@ -252,6 +265,36 @@ class ApiClient:
         except Exception as e:
             return False, f"멤버 초대 오류: {str(e)}"
 
+    def invite_members(self, repo_id: str, member_keys: list,
+                      access_token: str) -> Tuple[bool, str]:
+        """
+        멤버 일괄 초대 (배치)
+
+        초대할 멤버 수만큼 요청을 반복하지 않고 한 번의 요청으로 전송합니다.
+        (rotate_team_keys와 동일한 일괄 전송 방식)
+
+        Args:
+            repo_id: 저장소 ID (UUID 문자열)
+            member_keys: [{"email": "...", "encryptedTeamKey": "..."}, ...]
+            access_token: JWT 토큰
+
+        Returns:
+            (성공 여부, 메시지)
+        """
+        try:
+            resp = self.session.post(
+                f"{self.team_service_url}/api/teams/{repo_id}/members/batch",
+                json={"members": member_keys},
+                headers=self._get_headers(access_token)
+            )
+            success, data = self._handle_response(resp)
+            if success:
+                return True, "멤버 일괄 초대 성공"
+            error_msg = data if isinstance(data, str) else str(data)
+            return False, f"멤버 일괄 초대 실패: {error_msg}"
+        except Exception as e:
+            return False, f"멤버 일괄 초대 오류: {str(e)}"
+
     def get_members(self, repo_id: str, access_token: str) -> Tuple[bool, Optional[List]]:
         """멤버 목록 조회"""
         try:
@@ -521,6 +564,30 @@ class ApiClient:
         except Exception as e:
             return False, f"데모 동기화 오류: {str(e)}"
 
+    def get_team_version(self, repo_id: str, access_token: str) -> Tuple[bool, Any]:
+        """
+        팀의 최신 청크 버전만 조회 (경량 메타데이터 엔드포인트)
+
+        전체 청크를 동기화하지 않고 버전 정수 하나만 받아온다.
+        서버가 아직 이 엔드포인트를 제공하지 않으면 404가 반환되므로
+        호출자는 실패 시 증분 동기화로 폴백해야 한다.
+
+        Args:
+            repo_id: 저장소 ID (UUID 문자열)
+            access_token: 인증 토큰
+
+        Returns:
+            (성공 여부, {"version": int} 또는 에러 메시지)
+        """
+        try:
+            resp = self.session.get(
+                f"{self.core_service_url}/api/teams/{repo_id}/version",
+                headers=self._get_headers(access_token)
+            )
+            return self._handle_response(resp)
+        except Exception as e:
+            return False, f"팀 버전 조회 오류: {str(e)}"
+
     # ==================== Artifact API (SeRVe-Core) ====================
 
     def upload_artifact_request(
@@ -7,6 +7,7 @@ flat storage + database status tracking.
 """
 import hashlib
 import logging
+import shutil
 from pathlib import Path
 from typing import Optional
 
@@ -140,7 +141,6 @@ def store_artifact(source_path: Path, artifact_id: str) -> tuple[str, Path]:
     dest_path = artifacts_dir / object_key
     
     # Copy file (overwrite if exists)
-    import shutil
     shutil.copy2(source_path, dest_path)
     
     logger.debug(f"Stored artifact: {source_path} → {dest_path}")
@@ -159,9 +159,11 @@ def get_artifact_size(object_key: str) -> Optional[int]:
         File size in bytes, or None if file does not exist
     """
     artifact_path = get_artifact_path(object_key)
-    if artifact_path.exists():
+    try:
+        # Single stat call; exists() would stat the same path twice
         return artifact_path.stat().st_size
-    return None
+    except FileNotFoundError:
+        return None
 
 
 def artifact_exists(object_key: str) -> bool:
@@ -191,11 +193,14 @@ def delete_artifact(object_key: str) -> bool:
         OSError: If deletion fails
     """
     artifact_path = get_artifact_path(object_key)
-    if artifact_path.exists():
+    try:
+        # One unlink syscall; the exists()-then-unlink pattern stats first
+        # and races with concurrent deleters
         artifact_path.unlink()
-        logger.debug(f"Deleted artifact: {artifact_path}")
-        return True
-    return False
+    except FileNotFoundError:
+        return False
+    logger.debug(f"Deleted artifact: {artifact_path}")
+    return True
 
 
 def cleanup_orphan_artifacts() -> list[str]:
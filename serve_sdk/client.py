@@ -11,11 +11,20 @@ End-to-End 암호화를 구현.
 3. Zero-Trust: 서버는 평문 데이터나 원본 키를 절대 보지 못함
 """
 
+import base64
+import hashlib
+import logging
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional, Tuple, List, Dict, Any
 from .session import Session
 from .security.crypto_utils import CryptoUtils
 from .api_client import ApiClient
 
+logger = logging.getLogger(__name__)
+
 
 class ServeClient:
     """
@@ -28,12 +37,14 @@ class ServeClient:
         client.upload_document("secret content", repo_id=1)
     """
 
-    def __init__(self, server_url: str = "http://localhost:8080", team_service_url: Optional[str] = None, core_service_url: Optional[str] = None):
+    def __init__(self, server_url: str = "http://localhost:8080", team_service_url: Optional[str] = None,
+                 core_service_url: Optional[str] = None, http_session=None):
         """
         Args:
             server_url: Auth 서버 URL (기본값: http://localhost:8080)
             team_service_url: Team 서비스 URL (기본값: http://localhost:8082)
             core_service_url: Core 서비스 URL (기본값: http://localhost:8083)
+            http_session: 여러 ServeClient가 공유할 requests.Session (선택)
         """
         if team_service_url is None:
             # 기본값: 포트만 8082로 변경
@@ -41,10 +52,21 @@ class ServeClient:
         if core_service_url is None:
             # 기본값: 포트만 8083으로 변경
             core_service_url = server_url.replace(':8080', ':8083')
-        self.api = ApiClient(server_url, team_service_url, core_service_url)
+        self.api = ApiClient(server_url, team_service_url, core_service_url,
+                             http_session=http_session)
         self.crypto = CryptoUtils()
         self.session = Session()
 
+        # 배치 메서드들이 공유하는 스레드 풀 (lazy 생성)
+        # 호출마다 풀을 만들고 없애면 스레드 생성 비용을 반복 지불하고
+        # ApiClient 세션의 커넥션 풀도 매번 식는다
+        self._executor = None
+
+        # 문서별 마지막 업로드 페이로드 해시 — 내용이 그대로인 재업로드를
+        # 네트워크 호출 없이 건너뛰기 위한 캐시
+        # {(repo_id, file_name): blake2b 해시}
+        self._last_upload_hashes: Dict[Tuple[str, str], str] = {}
+
     # ==================== 내부 헬퍼 메서드 ====================
 
     def _ensure_authenticated(self):
@@ -108,6 +130,37 @@ class ServeClient:
         self.session.cache_team_key(repo_id, team_key)
         return team_key
 
+    def _get_executor(self):
+        """
+        배치 메서드 공용 스레드 풀 반환 (없으면 생성, 내부용)
+
+        upload_documents / invite_members / download_chunks_from_documents가
+        하나의 풀을 재사용하여 호출마다 스레드를 새로 만들지 않는다.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=8)
+        return self._executor
+
+    def _fetch_document_index(self, repo_id: str) -> Tuple[Optional[Dict[str, Dict]], str]:
+        """
+        문서 목록을 한 번 조회해 fileName → 문서 딕셔너리로 반환 (내부용)
+
+        목록을 매번 선형 탐색하지 않고 한 번의 순회로 인덱스를 만들어
+        이후 조회를 O(1)로 처리한다.
+
+        Args:
+            repo_id: 저장소 ID (UUID 문자열)
+
+        Returns:
+            ({fileName: 문서 딕셔너리} 또는 None, 메시지)
+        """
+        success, response = self.api.get_documents(repo_id, self.session.access_token)
+        if not success:
+            return None, f"문서 목록 조회 실패: {response}"
+
+        documents = response.get('documents', []) if isinstance(response, dict) else []
+        return {doc.get("fileName"): doc for doc in documents}, "조회 성공"
+
     # ==================== 인증 API ====================
 
     def signup(self, email: str, password: str) -> Tuple[bool, str]:
@@ -326,6 +379,77 @@ class ServeClient:
         except Exception as e:
             return False, f"멤버 초대 오류: {str(e)}"
 
+    def invite_members(self, repo_id: str, emails: List[str]) -> List[Tuple[bool, str]]:
+        """
+        여러 멤버 동시 초대 (배치)
+
+        공개키 조회는 스레드 풀로 동시에 수행하고, 팀 키 래핑은 클라이언트에서
+        한 번에 처리한 뒤 배치 API로 단일 요청만 전송합니다. 초대 단계의
+        왕복 횟수가 멤버 수 N에 비례하지 않고 O(1)이 됩니다.
+
+        배치 엔드포인트를 지원하지 않는 서버에서는 멤버별 초대 API를
+        스레드 풀로 병렬 호출하는 방식으로 폴백합니다.
+
+        Args:
+            repo_id: 저장소 ID (UUID 문자열)
+            emails: 초대할 이메일 목록
+
+        Returns:
+            입력 순서와 동일한 (성공 여부, 메시지) 목록
+        """
+        self._ensure_authenticated()
+
+        if not emails:
+            return []
+
+        # 팀 키를 먼저 한 번만 로드 (워커들의 중복 키 조회/복호화 방지)
+        try:
+            team_key = self._ensure_team_key(repo_id)
+        except Exception as e:
+            return [(False, f"멤버 초대 오류: {str(e)}")] * len(emails)
+
+        # 1. 공개키 조회는 독립적인 HTTP 왕복이므로 공유 풀에서 병렬 수행
+        key_results = list(self._get_executor().map(
+            lambda email: self.api.get_user_public_key(email, self.session.access_token),
+            emails
+        ))
+
+        # 2. 조회된 공개키로 팀 키 래핑 (실패한 이메일은 결과에 바로 기록)
+        results: List[Optional[Tuple[bool, str]]] = []
+        member_keys = []
+        for email, (success, public_key_json) in zip(emails, key_results):
+            if not success:
+                results.append((False, f"사용자 공개키 조회 실패: {public_key_json}"))
+                continue
+            try:
+                recipient_public_key = self.crypto.parse_public_key_json(public_key_json)
+                encrypted_team_key = self.crypto.wrap_aes_key(team_key, recipient_public_key)
+            except Exception as e:
+                results.append((False, f"멤버 초대 오류: {str(e)}"))
+                continue
+            member_keys.append({"email": email, "encryptedTeamKey": encrypted_team_key})
+            results.append(None)  # 배치 전송 결과로 채움
+
+        # 3. 래핑된 키들을 단일 배치 요청으로 전송
+        if not member_keys:
+            return [r for r in results if r is not None]
+
+        batch_result = self.api.invite_members(
+            repo_id, member_keys, self.session.access_token
+        )
+        if batch_result[0]:
+            return [batch_result if r is None else r for r in results]
+
+        # 배치 엔드포인트 미지원 서버 대비: 멤버별 초대 API로 폴백
+        # (get_current_version의 경량 엔드포인트 → 기존 경로 폴백과 동일한 패턴)
+        fallback_results = iter(self._get_executor().map(
+            lambda mk: self.api.invite_member(
+                repo_id, mk["email"], mk["encryptedTeamKey"], self.session.access_token
+            ),
+            member_keys
+        ))
+        return [next(fallback_results) if r is None else r for r in results]
+
     def get_members(self, repo_id: str) -> Tuple[Optional[List], str]:
         """멤버 목록 조회"""
         self._ensure_authenticated()
@@ -475,6 +599,37 @@ class ServeClient:
         except Exception as e:
             return False, f"업로드 오류: {str(e)}"
 
+    def upload_documents(self, plaintexts: List[str], repo_id: str) -> List[Tuple[bool, str]]:
+        """
+        여러 문서 동시 업로드 (배치)
+
+        문서별 업로드는 서로 독립적인 HTTP 왕복이므로 스레드 풀로 동시에
+        전송합니다. N개 문서의 총 소요 시간이 ~N·L에서 ~L(L=왕복 지연)으로
+        줄어듭니다. 팀 키는 첫 호출에서 캐싱되어 이후 요청이 재사용합니다.
+
+        Args:
+            plaintexts: 평문 내용 목록
+            repo_id: 저장소 ID (UUID 문자열)
+
+        Returns:
+            입력 순서와 동일한 (성공 여부, 메시지) 목록
+        """
+        self._ensure_authenticated()
+
+        if not plaintexts:
+            return []
+
+        # 팀 키를 미리 로드하여 워커들이 동시에 키 조회를 중복 수행하지 않도록 함
+        try:
+            self._ensure_team_key(repo_id)
+        except Exception as e:
+            return [(False, f"업로드 오류: {str(e)}")] * len(plaintexts)
+
+        return list(self._get_executor().map(
+            lambda plaintext: self.upload_document(plaintext, repo_id),
+            plaintexts
+        ))
+
     def download_document(self, doc_id: str, repo_id: str) -> Tuple[Optional[str], str]:
         """
         [사용 중단] 문서 다운로드 (Federated Model에서 지원하지 않음)
@@ -513,7 +668,13 @@ class ServeClient:
             (성공 여부, 메시지)
         """
         self._ensure_authenticated()
-        return self.api.delete_document(repo_id, doc_id, self.session.access_token)
+        success, message = self.api.delete_document(repo_id, doc_id, self.session.access_token)
+        if success:
+            # 삭제 후 동일 페이로드 재업로드가 "변경사항 없음"으로 생략되지 않도록
+            # 해당 저장소의 업로드 해시 캐시를 무효화한다.
+            for key in [k for k in self._last_upload_hashes if k[0] == repo_id]:
+                del self._last_upload_hashes[key]
+        return success, message
 
     # ==================== 벡터 청크 API ====================
 
@@ -538,6 +699,26 @@ class ServeClient:
         self._ensure_authenticated()
 
         try:
+            # 0. 내용 해시로 무변경 재업로드 감지
+            # AEAD 암호문은 호출마다 달라지므로 평문 기준으로 비교한다.
+            # 부분 스킵은 DEK 교체 시 기존 청크를 복호화 불가로 만들 수 있어
+            # 페이로드 전체가 동일할 때만 업로드를 생략한다.
+            # 각 필드는 인덱스·길이 접두사로 구분해 넣는다. 구분자 없이 이어
+            # 붙이면 청크 경계만 다른 페이로드가 같은 해시로 충돌한다.
+            digest = hashlib.blake2b(digest_size=16)
+            for chunk in chunks_data:
+                data = chunk["data"]
+                data_bytes = data if isinstance(data, bytes) else str(data).encode('utf-8')
+                digest.update(f"{chunk['chunkIndex']}:{len(data_bytes)}:".encode('utf-8'))
+                digest.update(data_bytes)
+            payload_hash = digest.hexdigest()
+
+            # 호출자가 DEK를 직접 지정했으면 내용이 같아도 생략하지 않는다 —
+            # 시나리오 단위 공유 DEK로 문서를 다시 래핑해야 할 수 있다.
+            cache_key = (repo_id, file_name)
+            if dek is None and self._last_upload_hashes.get(cache_key) == payload_hash:
+                return True, "변경사항 없음 (업로드 생략)"
+
             # 1. 팀 키 가져오기 (KEK - Key Encryption Key)
             team_key = self._ensure_team_key(repo_id)
 
@@ -564,7 +745,7 @@ class ServeClient:
             encrypted_dek = self.crypto.wrap_key_with_aes(dek, team_key)
 
             # 5. 서버에 업로드 (암호화된 DEK 포함)
-            return self.api.upload_chunks(
+            success, message = self.api.upload_chunks(
                 repo_id,  # team_id
                 file_name,
                 encrypted_chunks,
@@ -572,6 +753,11 @@ class ServeClient:
                 encrypted_dek  # Base64 인코딩된 암호화된 DEK
             )
 
+            # 성공한 업로드만 해시 기록 (실패 시 다음 호출에서 재시도)
+            if success:
+                self._last_upload_hashes[cache_key] = payload_hash
+            return success, message
+
         except Exception as e:
             return False, f"청크 업로드 오류: {str(e)}"
 
@@ -597,22 +783,15 @@ class ServeClient:
         self._ensure_authenticated()
 
         try:
-            # 1. 문서 목록 조회하여 fileName → documentId + encryptedDEK 가져오기
-            success, response = self.api.get_documents(repo_id, self.session.access_token)
-            if not success:
-                return None, f"문서 목록 조회 실패: {response}"
-            
-            # Extract documents array from response
-            documents = response.get('documents', []) if isinstance(response, dict) else []
+            # 1. 문서 인덱스 조회 (fileName → 문서 딕셔너리)
+            doc_index, message = self._fetch_document_index(repo_id)
+            if doc_index is None:
+                return None, message
 
-            # 2. fileName으로 documentId 및 encryptedDEK 찾기
-            document_id = None
-            encrypted_dek_bytes = None
-            for doc in documents:
-                if doc.get("fileName") == file_name:
-                    document_id = doc.get("docId")
-                    encrypted_dek_bytes = doc.get("encryptedDEK")  # byte[] 형식
-                    break
+            # 2. fileName으로 documentId 및 encryptedDEK 찾기 (O(1) 조회)
+            doc = doc_index.get(file_name)
+            document_id = doc.get("docId") if doc else None
+            encrypted_dek_bytes = doc.get("encryptedDEK") if doc else None  # byte[] 형식
 
             if not document_id:
                 return None, f"문서를 찾을 수 없습니다: {file_name}"
@@ -634,7 +813,6 @@ class ServeClient:
             team_key = self._ensure_team_key(repo_id)
 
             # 6. Envelope Encryption: 팀 키로 DEK 언래핑(복호화)
-            import base64
             if isinstance(encrypted_dek_bytes, list):
                 # byte[] → Base64 변환
                 encrypted_dek = base64.b64encode(bytes(encrypted_dek_bytes)).decode('utf-8')
@@ -646,6 +824,8 @@ class ServeClient:
             dek = self.crypto.unwrap_key_with_aes(encrypted_dek, team_key)
 
             # 7. 각 청크를 DEK로 복호화 (팀 키가 아님!)
+            # 핫 루프: 속성 체인 조회를 루프 밖에서 로컬에 바인딩
+            decrypt_data = self.crypto.decrypt_data
             decrypted_chunks = []
             for chunk in all_chunks:
                 chunk_index = chunk["chunkIndex"]
@@ -656,7 +836,7 @@ class ServeClient:
                     encrypted_blob = base64.b64encode(bytes(encrypted_blob)).decode('utf-8')
 
                 # DEK로 복호화 (팀 키가 아님!)
-                plaintext = self.crypto.decrypt_data(encrypted_blob, dek)
+                plaintext = decrypt_data(encrypted_blob, dek)
 
                 decrypted_chunks.append({
                     "chunkIndex": chunk_index,
@@ -671,6 +851,39 @@ class ServeClient:
         except Exception as e:
             return None, f"청크 다운로드 오류: {str(e)}"
 
+    def download_chunks_from_documents(self, file_names: List[str],
+                                       repo_id: str) -> Dict[str, Tuple[Optional[List[Dict]], str]]:
+        """
+        여러 문서의 청크를 동시에 가져오기 (파이프라인 다운로드)
+
+        문서별 download_chunks_from_document 호출은 독립적인 HTTP 왕복이므로
+        스레드 풀로 병렬 수행합니다. N개 문서 다운로드 시간이 합계가 아닌
+        가장 느린 단일 다운로드에 수렴합니다.
+
+        Args:
+            file_names: 파일명 목록
+            repo_id: 저장소 ID (팀 키 조회용)
+
+        Returns:
+            {file_name: (청크 목록 또는 None, 메시지)} 딕셔너리
+        """
+        self._ensure_authenticated()
+
+        if not file_names:
+            return {}
+
+        # 팀 키를 미리 캐싱하여 워커들의 중복 키 조회 방지
+        try:
+            self._ensure_team_key(repo_id)
+        except Exception as e:
+            return {name: (None, f"청크 다운로드 오류: {str(e)}") for name in file_names}
+
+        results = self._get_executor().map(
+            lambda file_name: (file_name, self.download_chunks_from_document(file_name, repo_id)),
+            file_names
+        )
+        return dict(results)
+
     def get_encrypted_chunks_from_document(self, file_name: str, repo_id: str) -> Tuple[Optional[List[Dict]], str]:
         """
         서버 관리자 뷰용: 암호화된 청크 데이터 가져오기 (복호화하지 않음)
@@ -686,34 +899,30 @@ class ServeClient:
         self._ensure_authenticated()
 
         try:
-            # 1. 문서 목록 조회하여 fileName → documentId 가져오기
-            success, response = self.api.get_documents(repo_id, self.session.access_token)
-            if not success:
-                return None, f"문서 목록 조회 실패: {response}"
-            
-            # Extract documents array from response
-            documents = response.get('documents', []) if isinstance(response, dict) else []
+            # 1. 문서 인덱스 조회 (fileName → 문서 딕셔너리)
+            doc_index, message = self._fetch_document_index(repo_id)
+            if doc_index is None:
+                return None, message
 
-            # 2. fileName으로 documentId 찾기
-            document_id = None
-            for doc in documents:
-                if doc.get("fileName") == file_name:
-                    document_id = doc.get("docId")
-                    break
+            # 2. fileName으로 documentId 찾기 (O(1) 조회)
+            doc = doc_index.get(file_name)
+            document_id = doc.get("docId") if doc else None
 
             if not document_id:
                 return None, f"문서를 찾을 수 없습니다: {file_name}"
 
-            # 3. 동기화 API로 팀의 모든 청크 가져오기
-            success, all_chunks = self.api.sync_team_chunks(repo_id, -1, self.session.access_token)
+            # 3. 해당 문서의 청크만 직접 조회 (팀 전체 동기화 후 필터링하지 않음)
+            success, response = self.api.get_chunks(repo_id, document_id, self.session.access_token)
             if not success:
-                return None, f"청크 동기화 실패: {all_chunks}"
+                return None, f"청크 조회 실패: {response}"
 
-            # 4. 해당 문서의 청크만 필터링 (암호화된 상태 그대로)
-            import base64
+            # Extract chunks array from response
+            all_chunks = response.get('chunks', []) if isinstance(response, dict) else []
+
+            # 4. 암호화된 상태 그대로 정리
             encrypted_chunks = []
             for chunk in all_chunks:
-                if chunk.get("documentId") == document_id and not chunk.get("isDeleted", False):
+                if not chunk.get("isDeleted", False):
                     encrypted_blob = chunk.get("encryptedBlob")
 
                     # byte[] → Base64 변환
@@ -727,7 +936,7 @@ class ServeClient:
                     encrypted_chunks.append({
                         "chunkIndex": chunk["chunkIndex"],
                         "encryptedData": encrypted_data,
-                        "version": chunk["version"]
+                        "version": chunk.get("version")
                     })
 
             if not encrypted_chunks:
@@ -753,7 +962,12 @@ class ServeClient:
             (성공 여부, 메시지)
         """
         self._ensure_authenticated()
-        return self.api.delete_chunk(doc_id, chunk_index, self.session.access_token)
+        success, message = self.api.delete_chunk(doc_id, chunk_index, self.session.access_token)
+        if success:
+            # doc_id만으로는 (repo_id, file_name) 캐시 키를 특정할 수 없으므로
+            # 업로드 해시 캐시 전체를 무효화한다 (재업로드 생략 방지).
+            self._last_upload_hashes.clear()
+        return success, message
 
     def sync_document_chunks(self, doc_id: str, repo_id: str, last_version: int = 0) -> Tuple[Optional[List[Dict]], str]:
         """
@@ -807,7 +1021,6 @@ class ServeClient:
             if not encrypted_dek_bytes:
                 return None, "문서에 암호화된 DEK가 없습니다."
                 
-            import base64
             if isinstance(encrypted_dek_bytes, list):
                 encrypted_dek = base64.b64encode(bytes(encrypted_dek_bytes)).decode('utf-8')
             elif isinstance(encrypted_dek_bytes, bytes):
@@ -869,7 +1082,6 @@ class ServeClient:
         self._ensure_authenticated()
 
         try:
-            import base64
             # 0. 문서 목록 먼저 조회 (DEK 찾기용)
             success, response = self.api.get_documents(repo_id, self.session.access_token)
             if not success:
@@ -898,6 +1110,9 @@ class ServeClient:
             dek_cache = {}
 
             # 4. 문서별로 그룹핑하면서 복호화
+            # 핫 루프: 속성 체인 조회를 루프 밖에서 로컬에 바인딩
+            decrypt_data = self.crypto.decrypt_data
+            unwrap_key = self.crypto.unwrap_key_with_aes
             documents_chunks = {}
             for chunk in chunks:
                 doc_id = chunk["documentId"]
@@ -923,8 +1138,8 @@ class ServeClient:
                             dek_b64 = base64.b64encode(bytes(dek_b64)).decode('utf-8')
                         elif isinstance(dek_b64, bytes):
                             dek_b64 = base64.b64encode(dek_b64).decode('utf-8')
-                        dek_cache[doc_id] = self.crypto.unwrap_key_with_aes(dek_b64, team_key)
-                        
+                        dek_cache[doc_id] = unwrap_key(dek_b64, team_key)
+
                     dek = dek_cache[doc_id]
 
                     # byte[] → Base64 변환 (필요시)
@@ -933,7 +1148,7 @@ class ServeClient:
 
                     # 복호화 (DEK 적용)
                     try:
-                        plaintext = self.crypto.decrypt_data(encrypted_blob, dek)
+                        plaintext = decrypt_data(encrypted_blob, dek)
                         result_chunk["data"] = plaintext
                     except Exception as e:
                         result_chunk["data"] = f"[Decryption Error: {e}]"
@@ -945,12 +1160,176 @@ class ServeClient:
                     documents_chunks[doc_id] = []
                 documents_chunks[doc_id].append(result_chunk)
 
+            # 5. 마지막 동기화 버전 기록 (단일 max() 패스, 호출자가 재탐색할 필요 없음)
+            latest_version = max(
+                (c["version"] for doc_chunks in documents_chunks.values() for c in doc_chunks),
+                default=last_version
+            )
+            self.session.update_sync_version(repo_id, latest_version)
+
             total_chunks = sum(len(chunks) for chunks in documents_chunks.values())
             return documents_chunks, f"{len(documents_chunks)}개 문서, 총 {total_chunks}개 청크 동기화 완료"
 
         except Exception as e:
             return None, f"팀 청크 동기화 오류: {str(e)}"
 
+    def iter_team_chunks(self, repo_id: str, last_version: int = 0):
+        """
+        팀 전체 증분 청크를 스트리밍으로 동기화 (제너레이터)
+
+        sync_team_chunks는 모든 청크를 복호화해 딕셔너리로 적재하므로
+        대규모 팀에서는 피크 메모리가 청크 총량에 비례한다. 이 제너레이터는
+        청크를 하나씩 복호화해 내보내므로 호출자가 처리한 청크를 바로
+        해제할 수 있다.
+
+        Args:
+            repo_id: 저장소 ID (UUID 문자열)
+            last_version: 마지막으로 알려진 버전 (기본값: 0)
+
+        Yields:
+            {"documentId": str, "chunkIndex": int, "data": str 또는 None,
+             "version": int, "isDeleted": bool}
+
+        Raises:
+            RuntimeError: 문서/청크 조회 실패 시
+        """
+        self._ensure_authenticated()
+
+        # 0. 문서 목록 먼저 조회 (DEK 찾기용)
+        success, response = self.api.get_documents(repo_id, self.session.access_token)
+        if not success:
+            raise RuntimeError(f"문서 메타데이터 동기화 실패: {response}")
+
+        documents = response.get('documents', []) if isinstance(response, dict) else []
+        doc_catalogue = {doc["docId"]: doc.get("encryptedDEK") for doc in documents}
+
+        # 1. 서버에서 팀 전체 변경된 청크들 조회
+        success, chunks = self.api.sync_team_chunks(
+            repo_id, last_version, self.session.access_token
+        )
+        if not success:
+            raise RuntimeError(f"팀 청크 동기화 실패: {chunks}")
+
+        if not chunks:
+            return
+
+        # 2. 팀 키 + 문서별 DEK 캐시 (청크들 사이에 재사용)
+        team_key = self._ensure_team_key(repo_id)
+        dek_cache = {}
+
+        # 핫 루프: 속성 체인 조회를 루프 밖에서 로컬에 바인딩
+        decrypt_data = self.crypto.decrypt_data
+        unwrap_key = self.crypto.unwrap_key_with_aes
+        update_sync_version = self.session.update_sync_version
+
+        for chunk in chunks:
+            doc_id = chunk["documentId"]
+            is_deleted = chunk.get("isDeleted", False)
+
+            result_chunk = {
+                "documentId": doc_id,
+                "chunkIndex": chunk["chunkIndex"],
+                "version": chunk["version"],
+                "isDeleted": is_deleted,
+                "data": None
+            }
+
+            if not is_deleted:
+                if doc_id not in dek_cache:
+                    dek_b64 = doc_catalogue.get(doc_id)
+                    if not dek_b64:
+                        continue  # DEK 없음
+                    if isinstance(dek_b64, list):
+                        dek_b64 = base64.b64encode(bytes(dek_b64)).decode('utf-8')
+                    elif isinstance(dek_b64, bytes):
+                        dek_b64 = base64.b64encode(dek_b64).decode('utf-8')
+                    dek_cache[doc_id] = unwrap_key(dek_b64, team_key)
+
+                encrypted_blob = chunk["encryptedBlob"]
+                if isinstance(encrypted_blob, list):
+                    encrypted_blob = base64.b64encode(bytes(encrypted_blob)).decode('utf-8')
+
+                try:
+                    result_chunk["data"] = decrypt_data(encrypted_blob, dek_cache[doc_id])
+                except Exception as e:
+                    result_chunk["data"] = f"[Decryption Error: {e}]"
+
+            update_sync_version(repo_id, result_chunk["version"])
+            yield result_chunk
+
+    def get_current_version(self, repo_id: str) -> Tuple[Optional[int], str]:
+        """
+        저장소의 현재(최신) 동기화 버전 조회
+
+        우선 경량 버전 엔드포인트(정수 하나만 전송)를 시도하고, 서버가
+        아직 지원하지 않으면 세션에 기록된 마지막 동기화 버전부터
+        증분 동기화 한 번으로 폴백한다. 어느 쪽이든 version=0부터
+        전체를 다시 받지 않는다.
+
+        Args:
+            repo_id: 저장소 ID (UUID 문자열)
+
+        Returns:
+            (최신 버전, 메시지) - 실패 시 (None, 오류 메시지)
+        """
+        self._ensure_authenticated()
+
+        # 1. 경량 메타데이터 엔드포인트 시도 (O(1) 바이트)
+        success, data = self.api.get_team_version(repo_id, self.session.access_token)
+        if success and isinstance(data, dict) and "version" in data:
+            version = int(data["version"])
+            self.session.update_sync_version(repo_id, version)
+            return version, "버전 조회 완료"
+
+        # 2. 폴백: 증분 동기화로 버전 갱신
+        last_version = self.session.get_sync_version(repo_id)
+        result, message = self.sync_team_chunks(repo_id, last_version)
+        if result is None:
+            return None, message
+
+        # sync_team_chunks가 세션 버전을 갱신하므로 그대로 반환
+        return self.session.get_sync_version(repo_id), "버전 조회 완료"
+
+    def wait_for_team_version(self, repo_id: str, target_version: int,
+                              timeout: float = 2.0) -> Tuple[bool, int]:
+        """
+        팀 버전이 target_version 이상이 될 때까지 대기 (지수 백오프 폴링)
+
+        고정 sleep 대신 사용: 서버 반영은 보통 수십 ms 안에 끝나므로
+        짧은 간격(50ms)부터 시작해 2배씩 늘리며 폴링하고, 조건이 충족되는
+        즉시 반환한다. 최악의 경우에도 timeout에서 멈춘다.
+
+        Args:
+            repo_id: 저장소 ID (UUID 문자열)
+            target_version: 기다릴 최소 버전
+            timeout: 최대 대기 시간(초, 기본값: 2.0)
+
+        Returns:
+            (조건 충족 여부, 마지막으로 확인된 버전)
+        """
+        self._ensure_authenticated()
+
+        deadline = time.monotonic() + timeout
+        interval = 0.05
+        current = self.session.get_sync_version(repo_id)
+
+        while True:
+            if current >= target_version:
+                return True, current
+
+            # 경량 버전 엔드포인트(지원 시) 또는 증분 동기화로 버전 갱신
+            version, _ = self.get_current_version(repo_id)
+            if version is not None:
+                current = version
+                if current >= target_version:
+                    return True, current
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False, current
+            time.sleep(min(interval, remaining))
+            interval *= 2
+
     # ==================== 내부 헬퍼 메서드 ====================
 
     def _reencrypt_all_documents(self, repo_id: str, new_team_key):
@@ -966,7 +1345,6 @@ class ServeClient:
             repo_id: 팀 ID
             new_team_key: 새로 생성된 팀 키 (KeysetHandle)
         """
-        import base64
 
         # 1. 현재 팀 키 백업 (이전 키)
         old_team_key = self.session.get_cached_team_key(repo_id)
@@ -1004,7 +1382,7 @@ class ServeClient:
                 dek = self.crypto.unwrap_key_with_aes(encrypted_dek, old_team_key)
             except Exception as e:
                 # 복호화 실패 시 스킵 (이미 새 키로 암호화되었거나 손상됨)
-                print(f"경고: 문서 {doc_id} DEK 복호화 실패: {e}")
+                logger.warning(f"문서 {doc_id} DEK 복호화 실패: {e}")
                 continue
 
             # 3-3. 새 팀 키로 DEK 래핑(암호화)
@@ -1104,7 +1482,6 @@ class ServeClient:
                     return None, "암호화된 데이터가 없습니다 (objectKey 또는 encryptedBlob 필요)"
                 
                 # Base64 문자열이면 디코딩
-                import base64
                 if isinstance(encrypted_blob, str):
                     encrypted_blob = base64.b64decode(encrypted_blob)
             else:
@@ -1165,7 +1542,7 @@ class ServeClient:
                         demo["decryptedData"] = decrypted_data
                     decrypted_demos.append(demo)
                 except Exception as e:
-                    print(f"경고: 데모 {demo.get('demoId')} 복호화 실패: {e}")
+                    logger.warning(f"데모 {demo.get('demoId')} 복호화 실패: {e}")
                     continue
 
             return decrypted_demos, "동기화 성공"
@@ -1228,9 +1605,6 @@ class ServeClient:
         self._ensure_authenticated()
         
         try:
-            from pathlib import Path
-            import requests
-            
             npz_file = Path(npz_path)
             if not npz_file.exists():
                 return False, f"파일이 존재하지 않습니다: {npz_path}"
@@ -1241,9 +1615,12 @@ class ServeClient:
                 size = npz_file.stat().st_size
             
             if sha256 is None:
-                import hashlib
+                # 파일 전체를 메모리에 올리지 않고 고정 크기 버퍼로 스트리밍 해싱
+                sha256_hash = hashlib.sha256()
                 with open(npz_file, 'rb') as f:
-                    sha256 = hashlib.sha256(f.read()).hexdigest()
+                    for block in iter(lambda: f.read(1024 * 1024), b''):
+                        sha256_hash.update(block)
+                sha256 = sha256_hash.hexdigest()
             
             success, resp_data = self.api.upload_artifact_request(
                 team_id=team_id,
@@ -1276,8 +1653,9 @@ class ServeClient:
             if not presigned_url or not artifact_id:
                 return False, f"서버 응답 오류: presignedUrl 또는 artifactId 없음"
             
+            # ApiClient의 커넥션 풀 재사용 (presigned URL마다 새 TLS 핸드셰이크 방지)
             with open(npz_file, 'rb') as f:
-                upload_resp = requests.put(presigned_url, data=f)
+                upload_resp = self.api.session.put(presigned_url, data=f)
             
             if upload_resp.status_code not in [200, 201]:
                 return False, f"S3 업로드 실패 (HTTP {upload_resp.status_code})"
@@ -1304,8 +1682,6 @@ class ServeClient:
         self._ensure_authenticated()
         
         try:
-            import requests
-            
             success, resp_data = self.api.get_artifact_presigned_url(
                 artifact_id, self.session.access_token
             )
@@ -1317,13 +1693,13 @@ class ServeClient:
             if not presigned_url:
                 return False, "서버 응답 오류: presignedUrl 없음"
             
-            download_resp = requests.get(presigned_url)
+            # ApiClient의 커넥션 풀 재사용 (presigned URL마다 새 TLS 핸드셰이크 방지)
+            download_resp = self.api.session.get(presigned_url)
             
             if download_resp.status_code != 200:
                 return False, f"S3 다운로드 실패 (HTTP {download_resp.status_code})"
             
             if output_path:
-                from pathlib import Path
                 output_file = Path(output_path)
                 output_file.parent.mkdir(parents=True, exist_ok=True)
                 
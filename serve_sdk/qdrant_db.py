@@ -8,18 +8,31 @@ from pathlib import Path
 from typing import List, Dict, Optional, Any
 
 import numpy as np
-from qdrant_client import QdrantClient
-from qdrant_client.models import (
-    Distance,
-    VectorParams,
-    PointStruct,
-    Filter,
-    FieldCondition,
-    MatchValue,
-)
+
+# qdrant_client is imported lazily inside the functions that need it:
+# importing it (and its grpc/pydantic dependency tree) at module load adds
+# noticeable startup cost to every process that merely imports serve_sdk
 
 logger = logging.getLogger(__name__)
 
+# Embedded Qdrant clients shared per storage path. Each QdrantClient(path=...)
+# opens the storage exclusively and re-initializes it, so creating one per
+# LocalQdrantDB instance is both slow and fails outright when two instances
+# point at the same directory in one process.
+_embedded_clients: Dict[str, Any] = {}
+
+
+def _get_embedded_client(qdrant_root: Path):
+    """Get (or create) the shared embedded client for a storage directory."""
+    from qdrant_client import QdrantClient
+
+    key = str(qdrant_root.resolve())
+    client = _embedded_clients.get(key)
+    if client is None:
+        client = QdrantClient(path=key)
+        _embedded_clients[key] = client
+    return client
+
 
 class LocalQdrantDB:
     """
@@ -55,8 +68,8 @@ class LocalQdrantDB:
         self.qdrant_root = qdrant_root
         self.qdrant_root.mkdir(parents=True, exist_ok=True)
         
-        # Initialize embedded Qdrant client
-        self.client = QdrantClient(path=str(self.qdrant_root))
+        # Reuse the shared embedded Qdrant client for this storage path
+        self.client = _get_embedded_client(self.qdrant_root)
         
         # Collection name
         self.collection_name = collection_name or f"team_{team_id}"
@@ -106,6 +119,8 @@ class LocalQdrantDB:
         # Build filter if episode_id specified
         query_filter = None
         if episode_id is not None:
+            from qdrant_client.models import Filter, FieldCondition, MatchValue
+
             query_filter = Filter(
                 must=[
                     FieldCondition(
@@ -236,6 +251,8 @@ class LocalQdrantDB:
         Returns:
             Episode metadata dict or None if not found
         """
+        from qdrant_client.models import Filter, FieldCondition, MatchValue
+
         # Scroll with filter
         scroll_result = self.client.scroll(
             collection_name=self.collection_name,
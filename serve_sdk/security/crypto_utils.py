@@ -17,6 +17,16 @@ from tink import JsonKeysetReader, JsonKeysetWriter
 import base64
 import io
 import hashlib
+import weakref
+
+# Tink 프리미티브 등록은 프로세스당 한 번이면 충분하므로 모듈 로드 시 1회만 수행
+# (CryptoUtils 인스턴스를 만들 때마다 레지스트리를 다시 건드리지 않음)
+try:
+    aead.register()
+    hybrid.register()
+except Exception:
+    # 이미 등록된 경우 무시 (멀티 인스턴스 환경 대응)
+    pass
 
 
 class CryptoUtils:
@@ -26,12 +36,33 @@ class CryptoUtils:
 
     def __init__(self):
         """Tink 라이브러리 초기화"""
+        # 핸들별 Aead 프리미티브 캐시 (청크마다 primitive() 재생성 방지)
+        # WeakKeyDictionary라서 키 핸들이 해제되면 캐시도 함께 사라짐
+        self._aead_cache = weakref.WeakKeyDictionary()
+
+    def _get_aead(self, aes_handle):
+        """
+        AES 핸들의 Aead 프리미티브를 캐시에서 가져오기
+
+        primitive(aead.Aead)는 호출할 때마다 키셋을 다시 파싱하므로
+        같은 팀 키로 청크를 연속 암복호화할 때 핸들당 한 번만 생성한다.
+
+        Args:
+            aes_handle: AES KeysetHandle
+
+        Returns:
+            Aead: 캐시된 (또는 새로 생성한) Aead 프리미티브
+        """
         try:
-            aead.register()
-            hybrid.register()
-        except Exception as e:
-            # 이미 등록된 경우 무시 (멀티 인스턴스 환경 대응)
-            pass
+            primitive = self._aead_cache.get(aes_handle)
+        except TypeError:
+            # weakref 불가능한 핸들은 캐시 없이 직접 생성
+            return aes_handle.primitive(aead.Aead)
+
+        if primitive is None:
+            primitive = aes_handle.primitive(aead.Aead)
+            self._aead_cache[aes_handle] = primitive
+        return primitive
 
     # ==================== 키 생성 ====================
 
@@ -179,7 +210,7 @@ class CryptoUtils:
         dek_json = self.serialize_aes_key(dek_handle)
 
         # 2. KEK로 암호화
-        env_aead = kek_handle.primitive(aead.Aead)
+        env_aead = self._get_aead(kek_handle)
         encrypted_bytes = env_aead.encrypt(dek_json.encode('utf-8'), b'')
 
         # 3. Base64 인코딩 (전송용)
@@ -200,7 +231,7 @@ class CryptoUtils:
         encrypted_bytes = base64.b64decode(encrypted_dek_b64)
 
         # 2. KEK로 복호화
-        env_aead = kek_handle.primitive(aead.Aead)
+        env_aead = self._get_aead(kek_handle)
         decrypted_json = env_aead.decrypt(encrypted_bytes, b'')
 
         # 3. JSON을 AES 핸들로 변환
@@ -219,7 +250,7 @@ class CryptoUtils:
         Returns:
             str: Base64로 인코딩된 암호문
         """
-        env_aead = aes_handle.primitive(aead.Aead)
+        env_aead = self._get_aead(aes_handle)
         ciphertext = env_aead.encrypt(plaintext.encode('utf-8'), b'')
         return base64.b64encode(ciphertext).decode('utf-8')
 
@@ -234,7 +265,7 @@ class CryptoUtils:
         Returns:
             str: 복호화된 평문
         """
-        env_aead = aes_handle.primitive(aead.Aead)
+        env_aead = self._get_aead(aes_handle)
         ciphertext = base64.b64decode(ciphertext_b64)
         decrypted = env_aead.decrypt(ciphertext, b'')
         return decrypted.decode('utf-8')
@@ -10,6 +10,7 @@ Session Manager - Zero-Trust 메모리 상태 관리
 암호화된 값을 받아와 복호화하는 lazy loading 패턴을 사용한다.
 """
 
+from collections import OrderedDict
 from typing import Optional, Dict
 
 
@@ -35,9 +36,16 @@ class Session:
         # 개인키에서 파생 가능
         self.public_key_handle = None
 
-        # 현재 작업 중인 저장소들의 팀 키 캐시
+        # 현재 작업 중인 저장소들의 팀 키 캐시 (LRU)
         # {repo_id (UUID 문자열): aes_keyset_handle} 형태
-        self.team_keys: Dict[str, any] = {}
+        # 항목 수를 제한하여 많은 팀을 오가는 장수 프로세스에서
+        # 사용하지 않는 키가 메모리에 계속 남지 않도록 한다
+        self.team_keys: "OrderedDict[str, any]" = OrderedDict()
+        self.max_cached_team_keys: int = 32
+
+        # 저장소별 마지막 동기화 버전
+        # {repo_id: 마지막으로 수신한 청크의 최대 version}
+        self.last_sync_versions: Dict[str, int] = {}
 
     def is_authenticated(self) -> bool:
         """로그인 상태 확인"""
@@ -71,17 +79,36 @@ class Session:
         return self.public_key_handle
 
     def cache_team_key(self, repo_id: str, aes_handle):
-        """저장소의 팀 키를 메모리에 캐싱"""
+        """저장소의 팀 키를 메모리에 캐싱 (LRU, 초과 시 가장 오래된 항목 제거)"""
         self.team_keys[repo_id] = aes_handle
+        self.team_keys.move_to_end(repo_id)
+        while len(self.team_keys) > self.max_cached_team_keys:
+            self.team_keys.popitem(last=False)
 
     def get_cached_team_key(self, repo_id: str) -> Optional[any]:
-        """캐시된 팀 키 조회 (없으면 None)"""
-        return self.team_keys.get(repo_id)
+        """캐시된 팀 키 조회 (없으면 None, 있으면 최근 사용으로 갱신)"""
+        aes_handle = self.team_keys.get(repo_id)
+        if aes_handle is not None:
+            self.team_keys.move_to_end(repo_id)
+        return aes_handle
+
+    def invalidate_team_key(self, repo_id: str):
+        """특정 저장소의 팀 키 캐시만 무효화 (키 로테이션 통지 시 사용)"""
+        self.team_keys.pop(repo_id, None)
 
     def clear_team_keys(self):
         """모든 팀 키 캐시 삭제"""
         self.team_keys.clear()
 
+    def update_sync_version(self, repo_id: str, version: int):
+        """저장소의 마지막 동기화 버전 갱신 (더 큰 값만 반영)"""
+        if version > self.last_sync_versions.get(repo_id, 0):
+            self.last_sync_versions[repo_id] = version
+
+    def get_sync_version(self, repo_id: str) -> int:
+        """저장소의 마지막 동기화 버전 조회 (없으면 0)"""
+        return self.last_sync_versions.get(repo_id, 0)
+
     def clear(self):
         """세션 전체 초기화 (로그아웃)"""
         self.access_token = None
@@ -90,6 +117,7 @@ class Session:
         self.private_key_handle = None
         self.public_key_handle = None
         self.team_keys.clear()
+        self.last_sync_versions.clear()
 
     def __repr__(self):
         return (f"<Session user_id={self.user_id} email={self.email} "
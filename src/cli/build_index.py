@@ -11,8 +11,13 @@ VLA 서버(ricl_openpi_libero)와 동일한 방식으로 FAISS 인덱스를 구
         index.faiss      ← FAISS 인덱스 파일
         metadata.npz     ← episode/step 메타데이터 (검색 결과 역참조용)
 """
+import hashlib
 import json
 import logging
+import os
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -44,6 +49,18 @@ def to_prompt(value) -> str:
     return value
 
 
+def compute_source_manifest(npz_files: List[Path]) -> str:
+    """소스 NPZ 파일 집합의 지문 계산 (경로 + mtime + 크기 기반).
+
+    지문이 이전 빌드와 같으면 임베딩 내용도 같으므로 재인덱싱을 건너뛸 수 있다.
+    """
+    h = hashlib.sha256()
+    for npz_path in npz_files:
+        stat = npz_path.stat()
+        h.update(f"{npz_path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
 def peek_npz_meta(npz_path: Path) -> dict:
     """NPZ 파일에서 메타데이터만 빠르게 읽어 반환."""
     try:
@@ -138,14 +155,27 @@ def interactive_select(npz_files: List[Path], root: Path) -> List[Path]:
 @click.option('--select', 'interactive', is_flag=True,
               help='인터랙티브 선택 모드: 각 데모를 보고 포함 여부 결정')
 @click.option('--overwrite', is_flag=True, help='기존 FAISS 인덱스 덮어쓰기')
+@click.option('--force', is_flag=True,
+              help='소스 파일이 바뀌지 않았어도 강제로 재인덱싱 (--overwrite와 함께 사용)')
 @click.option('--embedding-key', default=DEFAULT_EMBEDDING_KEY,
               help=f'사용할 임베딩 키 (기본값: {DEFAULT_EMBEDDING_KEY})')
+@click.option('--index-type', type=click.Choice(['flat', 'hnsw']), default='flat',
+              help='flat: 전수 탐색(기본값, 소규모), hnsw: 근사 그래프 탐색(대규모에서 10~100배 빠름)')
+@click.option('--quantize', is_flag=True,
+              help='int8 스칼라 양자화로 저장 (인덱스 크기 ~4배 감소, top-k recall 손실은 미미)')
+@click.option('--metric', type=click.Choice(['l2', 'cosine']), default='l2',
+              help='l2: L2 거리(기본값, VLA 서버와 동일), cosine: 단위 정규화 후 내적 '
+                   '(질의 시 정규화/sqrt 연산 제거)')
 def build_index_command(
     team_id: str,
     from_dir: Optional[str],
     interactive: bool,
     overwrite: bool,
+    force: bool,
     embedding_key: str,
+    index_type: str,
+    quantize: bool,
+    metric: str,
 ):
     """
     로컬 디렉토리의 processed_demo.npz 파일로 FAISS 벡터 인덱스를 구축합니다.
@@ -215,76 +245,118 @@ def build_index_command(
         click.echo("재구축하려면 --overwrite 옵션을 사용하세요.")
         raise click.Abort()
 
-    faiss_dir.mkdir(parents=True, exist_ok=True)
+    # 소스 집합 지문이 이전 빌드와 같으면 전체 임베딩 재수집을 건너뜀 (cache-aside)
+    source_manifest = compute_source_manifest(npz_files)
+    info_path = faiss_dir / "index_info.json"
+    if overwrite and not force and info_path.exists():
+        try:
+            prev_info = json.loads(info_path.read_text())
+        except Exception:
+            prev_info = {}
+        if (prev_info.get("source_manifest") == source_manifest
+                and prev_info.get("embedding_key") == embedding_key
+                and prev_info.get("index_type", "flat") == index_type
+                and prev_info.get("quantized", False) == quantize
+                and prev_info.get("metric", "L2") == ("IP" if metric == 'cosine' else "L2")):
+            click.echo(click.style("✓ 소스 NPZ 파일이 변경되지 않아 기존 인덱스를 재사용합니다.", fg="green"))
+            click.echo(f"  Location: {faiss_dir} (강제 재구축: --force)")
+            return
 
-    # Collect embeddings and metadata
+    # Collect embeddings and metadata.
+    # 스텝 단위 배열은 episode_idx/step_idx만 저장하고, 경로·프롬프트 등
+    # 에피소드 단위 값은 에피소드당 1행만 기록한다 (SoA) — 스텝마다 같은
+    # 문자열을 반복 저장하면 metadata.npz가 스텝 수에 비례해 부풀어 오른다.
     all_embeddings = []
-    # metadata: (episode_idx, step_idx, npz_path, prompt, num_steps, state_dim, action_dim)
-    all_meta_episode = []
-    all_meta_step = []
-    all_meta_path = []
-    all_meta_prompt = []
-    all_meta_num_steps = []
-    all_meta_state_dim = []
-    all_meta_action_dim = []
-    all_meta_relative = []
+    all_meta_episode = []   # per-step: episode id
+    all_meta_step = []      # per-step: step index
+    ep_ids = []             # per-episode metadata rows
+    ep_num_steps = []
+    ep_state_dim = []
+    ep_action_dim = []
+    ep_paths = []
+    ep_relative = []
+    ep_prompts = []
 
     episodes_processed = 0
     embedding_dim = None
 
-    with click.progressbar(enumerate(npz_files), length=len(npz_files),
-                           label="Processing NPZ files") as bar:
-        for episode_idx, npz_path in bar:
-            # Try primary embedding key, fallback to base_image_embeddings
-            try:
-                data = np.load(npz_path, allow_pickle=True)
-            except Exception as exc:
-                click.echo(click.style(f"\n✗ 로드 실패 {npz_path}: {exc}", fg="red"))
-                continue
-
-            actual_key = embedding_key
+    def _load_record(item):
+        """한 NPZ 파일에서 임베딩과 에피소드 메타데이터를 읽어온다 (워커 스레드용)."""
+        episode_idx, npz_path = item
+        record = {"episode_idx": episode_idx, "npz_path": npz_path, "error": None}
+        try:
+            data = np.load(npz_path, allow_pickle=True)
+        except Exception as exc:
+            record["error"] = f"로드 실패 {npz_path}: {exc}"
+            return record
+
+        # Try primary embedding key, fallback to base_image_embeddings
+        actual_key = embedding_key
+        if actual_key not in data.files:
+            actual_key = "base_image_embeddings"
             if actual_key not in data.files:
-                actual_key = "base_image_embeddings"
-                if actual_key not in data.files:
-                    click.echo(click.style(f"\n✗ 임베딩 키 없음: {npz_path}", fg="red"))
+                record["error"] = f"임베딩 키 없음: {npz_path}"
+                return record
+
+        emb = np.asarray(data[actual_key], dtype=np.float32)
+        if emb.ndim != 2:
+            record["error"] = f"잘못된 임베딩 shape {emb.shape}: {npz_path}"
+            return record
+
+        record["emb"] = emb
+        record["prompt"] = to_prompt(data["prompt"]) if "prompt" in data.files else ""
+        record["state_dim"] = int(data["state"].shape[1]) if "state" in data.files and np.asarray(data["state"]).ndim == 2 else -1
+        record["action_dim"] = int(data["actions"].shape[1]) if "actions" in data.files and np.asarray(data["actions"]).ndim == 2 else -1
+        return record
+
+    # NPZ 읽기는 디스크 I/O가 지배적이고 numpy가 읽는 동안 GIL을 풀기 때문에
+    # 스레드 풀로 파일들을 병렬 로드한다. pool.map은 제출 순서를 유지하므로
+    # episode_idx 순서와 인덱스 행 순서는 직렬 처리와 동일하다.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        records = pool.map(_load_record, enumerate(npz_files))
+        with click.progressbar(records, length=len(npz_files),
+                               label="Processing NPZ files") as bar:
+            for record in bar:
+                if record["error"]:
+                    click.echo(click.style(f"\n✗ {record['error']}", fg="red"))
+                    continue
+
+                episode_idx = record["episode_idx"]
+                npz_path = record["npz_path"]
+                emb = record["emb"]
+
+                num_steps_actual = emb.shape[0]
+                if embedding_dim is None:
+                    embedding_dim = emb.shape[1]
+                elif embedding_dim != emb.shape[1]:
+                    click.echo(click.style(
+                        f"\n✗ 임베딩 차원 불일치 (expected {embedding_dim}, got {emb.shape[1]}): {npz_path}",
+                        fg="red"
+                    ))
                     continue
 
-            emb = np.asarray(data[actual_key], dtype=np.float32)
-            if emb.ndim != 2:
-                click.echo(click.style(f"\n✗ 잘못된 임베딩 shape {emb.shape}: {npz_path}", fg="red"))
-                continue
-
-            num_steps_actual = emb.shape[0]
-            if embedding_dim is None:
-                embedding_dim = emb.shape[1]
-            elif embedding_dim != emb.shape[1]:
-                click.echo(click.style(
-                    f"\n✗ 임베딩 차원 불일치 (expected {embedding_dim}, got {emb.shape[1]}): {npz_path}",
-                    fg="red"
-                ))
-                continue
-
-            prompt = to_prompt(data["prompt"]) if "prompt" in data.files else ""
-            state_dim = int(data["state"].shape[1]) if "state" in data.files and np.asarray(data["state"]).ndim == 2 else -1
-            action_dim = int(data["actions"].shape[1]) if "actions" in data.files and np.asarray(data["actions"]).ndim == 2 else -1
-
-            try:
-                relative_path = str(npz_path.relative_to(root))
-            except ValueError:
-                relative_path = str(npz_path)
-
-            all_embeddings.append(emb)
-            for step_idx in range(num_steps_actual):
-                all_meta_episode.append(episode_idx)
-                all_meta_step.append(step_idx)
-                all_meta_path.append(str(npz_path))
-                all_meta_relative.append(relative_path)
-                all_meta_prompt.append(prompt)
-                all_meta_num_steps.append(num_steps_actual)
-                all_meta_state_dim.append(state_dim)
-                all_meta_action_dim.append(action_dim)
-
-            episodes_processed += 1
+                prompt = record["prompt"]
+                state_dim = record["state_dim"]
+                action_dim = record["action_dim"]
+
+                try:
+                    relative_path = str(npz_path.relative_to(root))
+                except ValueError:
+                    relative_path = str(npz_path)
+
+                all_embeddings.append(emb)
+                all_meta_episode.append(np.full(num_steps_actual, episode_idx, dtype=np.int32))
+                all_meta_step.append(np.arange(num_steps_actual, dtype=np.int32))
+
+                ep_ids.append(episode_idx)
+                ep_num_steps.append(num_steps_actual)
+                ep_state_dim.append(state_dim)
+                ep_action_dim.append(action_dim)
+                ep_paths.append(str(npz_path))
+                ep_relative.append(relative_path)
+                ep_prompts.append(prompt)
+
+                episodes_processed += 1
 
     if not all_embeddings:
         click.echo(click.style("❌ 유효한 임베딩을 찾을 수 없습니다.", fg="red"))
@@ -299,42 +371,99 @@ def build_index_command(
     click.echo(f"Embedding dimension: {embedding_dim}")
 
     # Build FAISS index (L2, same as VLA server)
-    click.echo("\n[+] Building FAISS index (L2)...")
-    index = faiss.IndexFlatL2(embedding_dim)
+    # cosine: 한 번 단위 정규화해 두면 내적이 곧 코사인 유사도 —
+    # 질의마다 정규화(sqrt + div)를 반복하지 않는다
+    metric_name = "IP" if metric == 'cosine' else "L2"
+    metric_const = faiss.METRIC_INNER_PRODUCT if metric == 'cosine' else faiss.METRIC_L2
+    if metric == 'cosine':
+        norms = np.linalg.norm(embeddings_matrix, axis=1, keepdims=True)
+        embeddings_matrix /= np.maximum(norms, 1e-12)
+
+    quant_label = ", int8" if quantize else ""
+    click.echo(f"\n[+] Building FAISS index ({metric_name}, {index_type}{quant_label})...")
+    if index_type == 'hnsw':
+        # 근사 탐색: 벡터 수가 수만 개 이상일 때 flat 대비 검색이 수십 배 빠름
+        if quantize:
+            index = faiss.IndexHNSWSQ(embedding_dim, faiss.ScalarQuantizer.QT_8bit, 32,
+                                      metric_const)
+        else:
+            index = faiss.IndexHNSWFlat(embedding_dim, 32, metric_const)
+        index.hnsw.efConstruction = 200
+        index.hnsw.efSearch = 64
+    elif quantize:
+        # float32 → int8 스칼라 양자화: 디스크/메모리 ~4배 절감
+        index = faiss.IndexScalarQuantizer(embedding_dim, faiss.ScalarQuantizer.QT_8bit,
+                                           metric_const)
+    elif metric == 'cosine':
+        index = faiss.IndexFlatIP(embedding_dim)
+    else:
+        index = faiss.IndexFlatL2(embedding_dim)
+
+    if not index.is_trained:
+        # 스칼라 양자화는 차원별 범위 학습이 필요 (전체 행렬로 1회)
+        index.train(embeddings_matrix)
     index.add(embeddings_matrix)
 
-    # Save FAISS index
-    index_path = faiss_dir / "index.faiss"
-    faiss.write_index(index, str(index_path))
-    click.echo(f"    Saved: {index_path}")
-
-    # Save metadata
-    meta_path = faiss_dir / "metadata.npz"
-    np.savez(
-        meta_path,
-        episode_idx=np.array(all_meta_episode, dtype=np.int32),
-        step_idx=np.array(all_meta_step, dtype=np.int32),
-        num_steps=np.array(all_meta_num_steps, dtype=np.int32),
-        state_dim=np.array(all_meta_state_dim, dtype=np.int32),
-        action_dim=np.array(all_meta_action_dim, dtype=np.int32),
-        npz_path=np.array(all_meta_path),
-        relative_path=np.array(all_meta_relative),
-        prompt=np.array(all_meta_prompt),
-    )
-    click.echo(f"    Saved: {meta_path}")
-
-    # Save index info
-    info = {
-        "team_id": team_id,
-        "embedding_key": embedding_key,
-        "embedding_dim": embedding_dim,
-        "num_vectors": total_vectors,
-        "num_episodes": episodes_processed,
-        "source_dir": str(root),
-        "metric": "L2",
-    }
-    info_path = faiss_dir / "index_info.json"
-    info_path.write_text(json.dumps(info, indent=2))
+    # 새 인덱스는 임시 디렉토리에 먼저 완성한 뒤 마지막에 교체한다.
+    # 빌드 도중 실패하거나 중단돼도 기존 인덱스는 손대지 않은 채 남고,
+    # 임시 디렉토리는 finally에서 정리되어 ~/.serve/faiss/에 쌓이지 않는다.
+    tmp_dir = faiss_dir.parent / f"{team_id}.new-{uuid.uuid4().hex}"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        # Save FAISS index
+        index_path = tmp_dir / "index.faiss"
+        faiss.write_index(index, str(index_path))
+        click.echo(f"    Saved: {faiss_dir / 'index.faiss'}")
+
+        # Save metadata
+        meta_path = tmp_dir / "metadata.npz"
+        np.savez(
+            meta_path,
+            episode_idx=np.concatenate(all_meta_episode),
+            step_idx=np.concatenate(all_meta_step),
+            ep_episode_id=np.array(ep_ids, dtype=np.int32),
+            ep_num_steps=np.array(ep_num_steps, dtype=np.int32),
+            ep_state_dim=np.array(ep_state_dim, dtype=np.int32),
+            ep_action_dim=np.array(ep_action_dim, dtype=np.int32),
+            ep_npz_path=np.array(ep_paths),
+            ep_relative_path=np.array(ep_relative),
+            ep_prompt=np.array(ep_prompts),
+        )
+        click.echo(f"    Saved: {faiss_dir / 'metadata.npz'}")
+
+        # Save index info
+        info = {
+            "team_id": team_id,
+            "embedding_key": embedding_key,
+            "embedding_dim": embedding_dim,
+            "num_vectors": total_vectors,
+            "num_episodes": episodes_processed,
+            "source_dir": str(root),
+            "metric": metric_name,
+            "index_type": index_type,
+            "quantized": quantize,
+            "source_manifest": source_manifest,
+        }
+        (tmp_dir / "index_info.json").write_text(json.dumps(info, indent=2))
+
+        # 완성된 디렉토리로 교체: 기존 인덱스를 옆으로 옮기고 새 것을 제자리에 rename.
+        # 검색 중인 프로세스가 절반만 쓰인 인덱스를 보는 구간이 없다.
+        old_dir = None
+        if faiss_dir.exists():
+            old_dir = faiss_dir.parent / f"{team_id}.old-{uuid.uuid4().hex}"
+            os.rename(faiss_dir, old_dir)
+        try:
+            os.rename(tmp_dir, faiss_dir)
+        except BaseException:
+            # 교체 실패 시 옆으로 옮겨둔 기존 인덱스를 원위치로 복원
+            if old_dir is not None:
+                os.rename(old_dir, faiss_dir)
+            raise
+        if old_dir is not None:
+            shutil.rmtree(old_dir, ignore_errors=True)
+    finally:
+        # 성공 시 tmp_dir은 rename으로 이미 사라져 no-op
+        shutil.rmtree(tmp_dir, ignore_errors=True)
 
     click.echo("")
     click.echo(click.style("✓ FAISS 벡터 인덱스 구축 완료!", fg="green", bold=True))
@@ -343,4 +472,5 @@ def build_index_command(
     click.echo(f"  Vectors    : {total_vectors}")
     click.echo(f"  Episodes   : {episodes_processed}")
     click.echo(f"  Embed dim  : {embedding_dim}")
-    click.echo(f"  Metric     : L2 (VLA 서버와 동일)")
+    metric_note = "L2 (VLA 서버와 동일)" if metric_name == "L2" else "IP (단위 정규화 + 내적 = 코사인)"
+    click.echo(f"  Metric     : {metric_note}")
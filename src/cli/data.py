@@ -3,6 +3,7 @@ import click
 import sqlite3
 import os
 import json
+import shutil
 from pathlib import Path
 from serve_sdk.local_db import get_default_db
 from .context import CLIContext
@@ -102,7 +103,6 @@ def upload(team_id, npz_file, prompt, kind):
         click.echo(f"   Artifact ID: {artifact_id}")
         
         # 업로드한 파일을 통합 demos 디렉토리에도 복사
-        import shutil
         demos_dir = Path.home() / ".serve" / "demos" / artifact_id
         demos_dir.mkdir(parents=True, exist_ok=True)
         dest_npz = demos_dir / "processed_demo.npz"
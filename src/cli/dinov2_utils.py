@@ -2,8 +2,11 @@
 DINOv2 embedding utilities for robot demo preprocessing.
 Ported from ricl_openpi_libero/src/openpi/policies/utils.py
 """
-import numpy as np
 import logging
+import math
+import os
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -15,18 +18,26 @@ EMBED_DIM = int(EMBEDDING_TYPE.split('PATCHES')[0]) * 768 if 'PATCHES' in EMBEDD
 IMAGENET_DEFAULT_MEAN = (0.485, 0.456, 0.406)
 IMAGENET_DEFAULT_STD = (0.229, 0.224, 0.225)
 
+# Process-wide model cache: torch.hub load + weight cast takes seconds,
+# so repeated load_dinov2() calls in one process reuse the same instance
+_dinov2_model = None
+
 
 def load_dinov2():
     """
     Load DINOv2 ViT-B/14 model from torch hub.
     Automatically uses GPU if available, CPU otherwise.
-    
+    The loaded model is cached for the lifetime of the process.
+
     Returns:
         DINOv2 model in eval mode
     """
+    global _dinov2_model
+    if _dinov2_model is not None:
+        return _dinov2_model
+
     import torch
-    import os
-    
+
     # Force safe CPU path if CUDA unavailable
     if not torch.cuda.is_available() and os.environ.get("XFORMERS_DISABLED") is None:
         os.environ["XFORMERS_DISABLED"] = "1"
@@ -34,13 +45,18 @@ def load_dinov2():
     
     dinov2 = torch.hub.load('facebookresearch/dinov2', 'dinov2_vitb14')
     dinov2.eval()
-    
+
+    # Cast weights to bfloat16 once at load time; embed() feeds bf16 inputs,
+    # so casting per inference call would rewrite every parameter each time
+    dinov2 = dinov2.to(torch.bfloat16)
+
     if torch.cuda.is_available():
         dinov2 = dinov2.cuda()
         logger.info("Loaded DINOv2 on CUDA")
     else:
         logger.info("Loaded DINOv2 on CPU")
-    
+
+    _dinov2_model = dinov2
     return dinov2
 
 
@@ -103,13 +119,11 @@ def embed(images: np.ndarray, dinov2):
         numpy array of embeddings, shape (B, EMBED_DIM)
     """
     import torch
-    import math
-    
+
     images = process_dinov2(images)
     
     with torch.no_grad():
         images = images.to(torch.bfloat16)
-        dinov2 = dinov2.to(torch.bfloat16)
         features = dinov2.forward_features(images)
         # features keys: ['x_norm_clstoken', 'x_norm_regtokens', 'x_norm_patchtokens', 'x_prenorm', 'masks']
         
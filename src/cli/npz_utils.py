@@ -32,9 +32,13 @@ def npz_to_chunks(npz_path: str, chunk_size_kb: int = 512) -> List[Dict[str, Any
     """
     # Read the NPZ file into memory
     with np.load(npz_path, allow_pickle=True) as data:
-        # Serialize all arrays to a BytesIO buffer
+        # Serialize all arrays to a BytesIO buffer.
+        # savez_compressed (zlib) shrinks the payload before it is encrypted —
+        # AEAD ciphertext is incompressible, so this is the last point where
+        # compression can reduce upload/download bytes. np.load on the
+        # receiving side handles compressed and uncompressed archives alike.
         buffer = io.BytesIO()
-        np.savez(buffer, **{key: data[key] for key in data.files})
+        np.savez_compressed(buffer, **{key: data[key] for key in data.files})
         binary_data = buffer.getvalue()
     
     # Calculate chunk size in bytes
@@ -7,13 +7,15 @@ required by SeRVe-Client's vector DB and VLA inference pipeline.
 """
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
 
 import click
-import h5py
 import numpy as np
-from PIL import Image
+
+# h5py와 PIL은 preprocess 실행 시에만 필요하므로 함수 내부에서 lazy import
+# (다른 serve 명령의 CLI 구동 시간에 무거운 import 비용을 전가하지 않음)
 
 from .image_utils import resize_with_pad, ensure_uint8_image
 from .dinov2_utils import load_dinov2, embed_with_batches, create_placeholder_embeddings, EMBED_DIM
@@ -148,7 +150,7 @@ def _prepare_action7(joint_velocity: np.ndarray, gripper_position: np.ndarray) -
     return np.concatenate([arm6, grip[:, :1]], axis=1)
 
 
-def _load_keep_mask(traj_h5: h5py.File, num_steps: int) -> np.ndarray:
+def _load_keep_mask(traj_h5: "h5py.File", num_steps: int) -> np.ndarray:
     """
     Load skip_action mask from trajectory file.
     
@@ -225,8 +227,16 @@ def _load_camera_frames(
             f"{len(frame_files)} vs expected {num_steps_after_mask} or {keep_mask.shape[0]}"
         )
     
-    # Load and stack frames
-    frames = np.stack([ensure_uint8_image(np.array(Image.open(p))) for p in frame_files], axis=0)
+    # Load and stack frames. PIL releases the GIL during JPEG/PNG decode,
+    # so a small thread pool overlaps per-frame decodes instead of running
+    # them serially; map() preserves frame order.
+    from PIL import Image
+
+    def _load_frame(path: Path) -> np.ndarray:
+        return ensure_uint8_image(np.array(Image.open(path)))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        frames = np.stack(list(pool.map(_load_frame, frame_files)), axis=0)
     
     # Rotate if requested
     if rotate_180:
@@ -269,11 +279,13 @@ def process_demo_folder(
         FileNotFoundError: If required files not found
         ValueError: If data shape mismatches occur
     """
+    import h5py
+
     out_file = demo_dir / "processed_demo.npz"
     if out_file.exists() and not overwrite:
         logger.info(f"Already processed: {demo_dir}")
         return
-    
+
     # Load trajectory data
     traj_path = _find_traj_file(demo_dir)
     with h5py.File(traj_path, "r") as traj_h5:
@@ -318,8 +330,13 @@ def process_demo_folder(
     else:
         if dinov2 is None:
             raise ValueError("dinov2 model required when use_placeholder_embeddings=False")
-        base_emb = embed_with_batches(base_image, dinov2)
-        wrist_emb = embed_with_batches(wrist_image, dinov2)
+        # Embed both camera streams in one batched pass: concatenating halves
+        # the number of partially-filled batches (a demo shorter than the
+        # batch size costs two model invocations when embedded separately)
+        both_emb = embed_with_batches(
+            np.concatenate([base_image, wrist_image], axis=0), dinov2
+        )
+        base_emb, wrist_emb = both_emb[:num_steps], both_emb[num_steps:]
     
     if base_emb.shape != (num_steps, EMBED_DIM):
         raise ValueError(f"Unexpected base embedding shape: {base_emb.shape}")
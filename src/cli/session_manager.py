@@ -5,16 +5,28 @@ from pathlib import Path
 SESSION_DIR = Path.home() / ".serve"
 SESSION_FILE = SESSION_DIR / "session.json"
 
+# (mtime, parsed dict) — 같은 프로세스에서 session.json을 반복 파싱하지 않기 위한 캐시
+_session_cache = None
+
 def get_session():
+    global _session_cache
     if not SESSION_FILE.exists():
+        _session_cache = None
         return None
     try:
+        mtime = SESSION_FILE.stat().st_mtime
+        if _session_cache is not None and _session_cache[0] == mtime:
+            return _session_cache[1]
         with open(SESSION_FILE, "r") as f:
-            return json.load(f)
+            data = json.load(f)
+        _session_cache = (mtime, data)
+        return data
     except Exception:
+        _session_cache = None
         return None
 
 def save_session(access_token, user_id, email, encrypted_private_key):
+    global _session_cache
     SESSION_DIR.mkdir(parents=True, exist_ok=True)
     session_data = {
         "access_token": access_token,
@@ -24,7 +36,10 @@ def save_session(access_token, user_id, email, encrypted_private_key):
     }
     with open(SESSION_FILE, "w") as f:
         json.dump(session_data, f)
-        
+    _session_cache = (SESSION_FILE.stat().st_mtime, session_data)
+
 def clear_session():
+    global _session_cache
+    _session_cache = None
     if SESSION_FILE.exists():
         os.remove(SESSION_FILE)
@@ -4,6 +4,7 @@ FAISS-based vector DB retrieval utilities for RAG-based VLA inference.
 VLA 서버(ricl_openpi_libero)와 동일하게 FAISS(L2) 인덱스를 사용합니다.
 ~/.serve/faiss/<team_id>/ 에 저장된 인덱스를 로드하여 유사도 검색을 수행합니다.
 """
+import heapq
 import json
 import logging
 from pathlib import Path
@@ -32,14 +33,9 @@ class LocalVectorDB:
 
         Raises:
             FileNotFoundError: If FAISS index not found
-            ImportError: If faiss-cpu not installed
+            ImportError: If faiss-cpu not installed (raised lazily on first
+                embedding search — prompt-only queries don't need faiss)
         """
-        try:
-            import faiss
-            self._faiss = faiss
-        except ImportError:
-            raise ImportError("faiss-cpu가 설치되지 않았습니다. 설치: pip install faiss-cpu")
-
         self.team_id = team_id
 
         if faiss_root is None:
@@ -62,19 +58,16 @@ class LocalVectorDB:
                 f"재빌드: serve data build-index {team_id} --overwrite"
             )
 
-        # Load FAISS index
-        self._index = faiss.read_index(str(index_path))
+        # FAISS index is loaded lazily: search_by_prompt/get_stats only need
+        # metadata, and reading a large index (plus importing faiss) costs
+        # hundreds of ms that prompt-only callers shouldn't pay
+        self._index_path = index_path
+        self._index = None
 
         # Load metadata
         meta = np.load(meta_path, allow_pickle=True)
         self._episode_idx = meta["episode_idx"]   # (N,) int32
         self._step_idx = meta["step_idx"]         # (N,) int32
-        self._num_steps = meta["num_steps"]       # (N,) int32
-        self._state_dim = meta["state_dim"]       # (N,) int32
-        self._action_dim = meta["action_dim"]     # (N,) int32
-        self._npz_path = meta["npz_path"]         # (N,) str
-        self._relative_path = meta["relative_path"]  # (N,) str
-        self._prompt = meta["prompt"]             # (N,) str
 
         # Load index info
         info_path = self.index_dir / "index_info.json"
@@ -83,7 +76,59 @@ class LocalVectorDB:
         else:
             self._info = {}
 
-        logger.info(f"Loaded FAISS index: {self.index_dir} ({self._index.ntotal} vectors)")
+        # L2 indexes return distances (lower = closer); IP indexes return
+        # similarities (higher = closer) over unit-normalized vectors
+        self._metric = self._info.get("metric", "L2")
+
+        # Build the per-episode metadata table and tokenized prompt sets once.
+        # Current indexes store episode-level values one row per episode (SoA);
+        # older indexes duplicated them per step, so fall back to extracting
+        # each episode's first row.
+        self._episodes: Dict[int, Dict] = {}
+        self._prompt_words: Dict[int, set] = {}
+        if "ep_episode_id" in meta.files:
+            for i, ep_id in enumerate(meta["ep_episode_id"]):
+                ep_id = int(ep_id)
+                prompt = str(meta["ep_prompt"][i])
+                self._episodes[ep_id] = {
+                    "episode_id": ep_id,
+                    "num_steps": int(meta["ep_num_steps"][i]),
+                    "state_dim": int(meta["ep_state_dim"][i]),
+                    "action_dim": int(meta["ep_action_dim"][i]),
+                    "processed_demo_path": str(meta["ep_npz_path"][i]),
+                    "relative_path": str(meta["ep_relative_path"][i]),
+                    "prompt": prompt,
+                }
+                self._prompt_words[ep_id] = set(prompt.casefold().split())
+        else:
+            # Legacy per-step layout: np.unique finds each episode's first row
+            _, first_rows = np.unique(self._episode_idx, return_index=True)
+            for i in first_rows:
+                ep_id = int(self._episode_idx[i])
+                prompt = str(meta["prompt"][i])
+                self._episodes[ep_id] = {
+                    "episode_id": ep_id,
+                    "num_steps": int(meta["num_steps"][i]),
+                    "state_dim": int(meta["state_dim"][i]),
+                    "action_dim": int(meta["action_dim"][i]),
+                    "processed_demo_path": str(meta["npz_path"][i]),
+                    "relative_path": str(meta["relative_path"][i]),
+                    "prompt": prompt,
+                }
+                self._prompt_words[ep_id] = set(prompt.casefold().split())
+
+        logger.info(f"Loaded index metadata: {self.index_dir} ({len(self._episode_idx)} vectors)")
+
+    def _get_index(self):
+        """Load the FAISS index on first use (embedding search only)."""
+        if self._index is None:
+            try:
+                import faiss
+            except ImportError:
+                raise ImportError("faiss-cpu가 설치되지 않았습니다. 설치: pip install faiss-cpu")
+            self._index = faiss.read_index(str(self._index_path))
+            logger.info(f"Loaded FAISS index: {self._index_path} ({self._index.ntotal} vectors)")
+        return self._index
 
     def search_by_embedding(
         self,
@@ -112,24 +157,68 @@ class LocalVectorDB:
             query_embedding = query_embedding.flatten()
 
         query = query_embedding.astype(np.float32).reshape(1, -1)
-        distances, indices = self._index.search(query, k)
+        if self._metric == "IP":
+            # stored vectors are unit-normalized; match the query to them
+            query /= np.maximum(np.linalg.norm(query, axis=1, keepdims=True), 1e-12)
+        distances, indices = self._get_index().search(query, k)
+        return self._hits_to_results(distances[0], indices[0])
+
+    def search_by_embeddings(
+        self,
+        query_embeddings: np.ndarray,
+        k: int = 5,
+    ) -> List[List[Dict]]:
+        """
+        Search for similar vectors for a batch of query embeddings.
 
+        FAISS handles multi-row queries natively, so K queries cost one
+        index traversal setup instead of K separate search calls.
+
+        Args:
+            query_embeddings: Query embeddings (Q, D)
+            k: Number of results per query
+
+        Returns:
+            List of per-query result lists (same format as search_by_embedding)
+        """
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+        if self._metric == "IP":
+            queries = queries / np.maximum(
+                np.linalg.norm(queries, axis=1, keepdims=True), 1e-12
+            )
+
+        distances, indices = self._get_index().search(queries, k)
+        return [
+            self._hits_to_results(dist_row, idx_row)
+            for dist_row, idx_row in zip(distances, indices)
+        ]
+
+    def _hits_to_results(self, distances: np.ndarray, indices: np.ndarray) -> List[Dict]:
+        """Convert one query's FAISS hits into result dicts."""
+        is_ip = self._metric == "IP"
         results = []
-        for dist, idx in zip(distances[0], indices[0]):
+        for dist, idx in zip(distances, indices):
             if idx < 0:
                 continue
-            score = 1.0 / (1.0 + float(dist))  # L2 → similarity
+            if is_ip:
+                score = float(dist)  # inner product is already a similarity
+                dist = 1.0 - score   # cosine distance for backward compatibility
+            else:
+                score = 1.0 / (1.0 + float(dist))  # L2 → similarity
+            ep = self._episodes[int(self._episode_idx[idx])]
             results.append({
                 "score": score,
                 "distance": float(dist),
-                "episode_id": int(self._episode_idx[idx]),
+                "episode_id": ep["episode_id"],
                 "step_index": int(self._step_idx[idx]),
-                "num_steps": int(self._num_steps[idx]),
-                "state_dim": int(self._state_dim[idx]),
-                "action_dim": int(self._action_dim[idx]),
-                "processed_demo_path": str(self._npz_path[idx]),
-                "relative_path": str(self._relative_path[idx]),
-                "prompt": str(self._prompt[idx]),
+                "num_steps": ep["num_steps"],
+                "state_dim": ep["state_dim"],
+                "action_dim": ep["action_dim"],
+                "processed_demo_path": ep["processed_demo_path"],
+                "relative_path": ep["relative_path"],
+                "prompt": ep["prompt"],
             })
 
         return results
@@ -149,44 +238,28 @@ class LocalVectorDB:
         Returns:
             List of unique episode metadata dicts
         """
-        # Collect unique episodes with their metadata
-        unique_episodes: Dict[int, Dict] = {}
-        for i in range(len(self._episode_idx)):
-            ep_id = int(self._episode_idx[i])
-            if ep_id not in unique_episodes:
-                unique_episodes[ep_id] = {
-                    "episode_id": ep_id,
-                    "num_steps": int(self._num_steps[i]),
-                    "state_dim": int(self._state_dim[i]),
-                    "action_dim": int(self._action_dim[i]),
-                    "processed_demo_path": str(self._npz_path[i]),
-                    "relative_path": str(self._relative_path[i]),
-                    "prompt": str(self._prompt[i]),
-                }
-
         if not query_prompt:
-            return list(unique_episodes.values())[:k]
-
-        # Keyword matching score
-        query_words = set(query_prompt.lower().split())
-        scored = []
-        for ep_id, ep_meta in unique_episodes.items():
-            prompt_words = set(ep_meta["prompt"].lower().split())
-            overlap = len(query_words & prompt_words)
-            scored.append((overlap, ep_meta))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [ep for score, ep in scored[:k] if score > 0 or not query_prompt]
+            return list(self._episodes.values())[:k]
+
+        # Keyword matching score (episode metadata and word sets are
+        # precomputed in __init__)
+        query_words = set(query_prompt.casefold().split())
+        scored = (
+            (len(query_words & self._prompt_words[ep_id]), ep_meta)
+            for ep_id, ep_meta in self._episodes.items()
+        )
+        # heapq.nlargest keeps only k candidates instead of sorting all episodes
+        top = heapq.nlargest(k, scored, key=lambda x: x[0])
+        return [ep for score, ep in top if score > 0]
 
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
-        unique_episodes = len(set(self._episode_idx.tolist()))
         return {
             "team_id": self.team_id,
             "index_dir": str(self.index_dir),
-            "num_vectors": self._index.ntotal,
-            "num_episodes": unique_episodes,
-            "embedding_dim": self._info.get("embedding_dim", self._index.d),
+            "num_vectors": len(self._episode_idx),
+            "num_episodes": len(self._episodes),
+            "embedding_dim": self._info.get("embedding_dim", "unknown"),
             "distance": self._info.get("metric", "L2"),
             "embedding_key": self._info.get("embedding_key", "unknown"),
         }